@@ -1,23 +1,81 @@
 # src/app.py
 from flask import Flask, request, jsonify, render_template, session, redirect, url_for
 from flask_cors import CORS
-from werkzeug.utils import secure_filename
 from werkzeug.security import generate_password_hash, check_password_hash
+import hashlib
 import os
 import json
-from datetime import datetime
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from database import Database
+from database import Database, decompress_text
 from resume_parser import ResumeParser
 from llm_matcher import LLMMatcher
 
+# Optional: server-side sessions keep the cookie down to a session id
+# instead of HMAC-signing and shipping the whole payload on every request
+try:
+    from flask_session import Session
+    FLASK_SESSION_AVAILABLE = True
+except ImportError:
+    FLASK_SESSION_AVAILABLE = False
+
+# Optional: orjson (Rust-backed) encodes the large list payloads several
+# times faster than the stdlib json behind flask.jsonify
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Optional: argon2 (C-backed) is much cheaper per hash than Werkzeug's
+# pbkdf2 default at equivalent security; fall back to Werkzeug if missing
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+    _password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+
+def hash_password(password):
+    """Hash a password with argon2 when available, else Werkzeug defaults"""
+    if ARGON2_AVAILABLE:
+        return _password_hasher.hash(password)
+    return generate_password_hash(password)
+
+def verify_password(password_hash, password):
+    """Verify a password against argon2 or legacy Werkzeug hashes"""
+    if ARGON2_AVAILABLE and password_hash.startswith('$argon2'):
+        try:
+            return _password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    # Accounts created before the argon2 switch keep verifying
+    return check_password_hash(password_hash, password)
+
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-change-in-production'
 CORS(app)
 
+# Server-side session store (SQLite lives next door, so a local file store
+# fits this deployment; swap SESSION_TYPE to 'redis' for multi-host setups)
+if FLASK_SESSION_AVAILABLE:
+    app.config.update(
+        SESSION_TYPE='filesystem',
+        SESSION_FILE_DIR=os.path.join('database', 'sessions'),
+        SESSION_USE_SIGNER=True
+    )
+    Session(app)
+
 # Configuration
 UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'pdf', 'docx'}
+ALLOWED_EXTENSIONS = frozenset(('.pdf', '.docx'))
 MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
@@ -32,8 +90,76 @@ db = Database()
 resume_parser = ResumeParser()
 llm_matcher = LLMMatcher()  # Use Ollama by default
 
+# Short-TTL cache of username -> user row so repeat logins and future
+# per-request principal checks skip the users table after warmup
+USER_CACHE_TTL = 300  # seconds
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+def _get_user_cached(username):
+    now = time.monotonic()
+    with _user_cache_lock:
+        entry = _user_cache.get(username)
+        if entry and entry[1] > now:
+            return entry[0]
+    user = db.get_user_by_username(username)
+    # Cache hits only: a cached miss would outlive registration on other
+    # workers, since _invalidate_user_cache is per-process
+    if user is not None:
+        with _user_cache_lock:
+            _user_cache[username] = (user, now + USER_CACHE_TTL)
+    return user
+
+def _invalidate_user_cache(username):
+    with _user_cache_lock:
+        _user_cache.pop(username, None)
+
+# Bounded pool for resume parsing so heavy PDF/DOCX extraction doesn't
+# monopolize request workers; also backs the async upload path
+PARSE_POOL = ThreadPoolExecutor(max_workers=4)
+
+def _parse_and_save(filepath, user_id):
+    """Parse a saved upload and persist it (runs on PARSE_POOL)"""
+    # raw_text is needed here because save_resume persists it
+    parsed_data = resume_parser.parse_resume(filepath, include_raw_text=True)
+    resume_id = db.save_resume(parsed_data, user_id)
+    parsed_data['id'] = resume_id
+    return resume_id, parsed_data
+
+def _log_parse_failure(future):
+    exc = future.exception()
+    if exc:
+        print(f"Background resume parse failed: {exc}")
+
+# In-process LRU cache of (resume_id, job_id) -> match result, so re-running
+# a match on the same pair skips the multi-second LLM round-trip
+MATCH_CACHE_SIZE = 2048
+_match_cache = OrderedDict()
+_match_cache_lock = threading.Lock()
+
+def _match_cache_get(key):
+    with _match_cache_lock:
+        result = _match_cache.get(key)
+        if result is not None:
+            _match_cache.move_to_end(key)
+        return result
+
+def _match_cache_put(key, result):
+    with _match_cache_lock:
+        _match_cache[key] = result
+        _match_cache.move_to_end(key)
+        while len(_match_cache) > MATCH_CACHE_SIZE:
+            _match_cache.popitem(last=False)
+
+def ojsonify(obj):
+    """jsonify replacement that serializes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return app.response_class(orjson.dumps(obj), mimetype='application/json')
+    return jsonify(obj)
+
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    # os.path.splitext avoids the rsplit list allocation on every upload
+    return bool(filename) and os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
 
 def login_required(f):
     """Decorator to require login"""
@@ -75,12 +201,13 @@ def register():
         return jsonify({'error': 'Username and password required'}), 400
     
     # Hash password
-    password_hash = generate_password_hash(password)
+    password_hash = hash_password(password)
     
     # Create user
     user_id = db.create_user(username, password_hash, email)
-    
+
     if user_id:
+        _invalidate_user_cache(username)
         return jsonify({'message': 'Registration successful', 'user_id': user_id}), 201
     else:
         return jsonify({'error': 'Username already exists'}), 400
@@ -96,10 +223,10 @@ def login():
     if not username or not password:
         return jsonify({'error': 'Username and password required'}), 400
     
-    # Get user
-    user = db.get_user_by_username(username)
+    # Get user (cached with a short TTL)
+    user = _get_user_cached(username)
     
-    if user and check_password_hash(user['password_hash'], password):
+    if user and verify_password(user['password_hash'], password):
         session['user_id'] = user['id']
         session['username'] = user['username']
         session['role'] = user['role']
@@ -138,20 +265,58 @@ def upload_resume():
         return jsonify({'error': 'Invalid file type. Only PDF and DOCX allowed'}), 400
     
     try:
-        # Save file
-        filename = secure_filename(file.filename)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{timestamp}_{filename}"
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        # Parse resume
-        parsed_data = resume_parser.parse_resume(filepath)
-        
-        # Save to database
-        resume_id = db.save_resume(parsed_data, session.get('user_id'))
-        parsed_data['id'] = resume_id
-        
+        # Name the file by content hash: identical re-uploads map to the
+        # same path, so we can skip both the disk write and the parse.
+        # The body is streamed to a temp file in fixed-size chunks while
+        # hashing incrementally — never buffered whole in memory — then
+        # renamed to its hash once the digest is known.
+        ext = os.path.splitext(file.filename)[1].lower()
+        hasher = hashlib.blake2b(digest_size=16)
+        fd, tmp_path = tempfile.mkstemp(dir=app.config['UPLOAD_FOLDER'], suffix=ext)
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    chunk = file.stream.read(64 * 1024)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    out.write(chunk)
+            content_hash = hasher.hexdigest()
+            filename = f"{content_hash}{ext}"
+            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+
+            # Per-user dedupe: identical content from another user still
+            # gets its own resume row (sharing the file on disk)
+            existing_id = db.get_resume_id_by_file_path(filepath, session.get('user_id'))
+            if existing_id:
+                os.remove(tmp_path)
+                return jsonify({
+                    'message': 'Resume already uploaded',
+                    'resume_id': existing_id,
+                    'duplicate': True
+                }), 200
+
+            os.replace(tmp_path, filepath)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        # Parsing is the slow step; run it on the bounded pool
+        future = PARSE_POOL.submit(_parse_and_save, filepath, session.get('user_id'))
+
+        if request.form.get('async') in ('1', 'true', 'yes'):
+            # Fire-and-forget: parsing and the DB insert finish in the
+            # background while the worker takes the next request
+            future.add_done_callback(_log_parse_failure)
+            return jsonify({
+                'message': 'Resume accepted, parsing in background',
+                'status': 'parsing',
+                'file': filename
+            }), 202
+
+        resume_id, parsed_data = future.result()
+
         return jsonify({
             'message': 'Resume uploaded and parsed successfully',
             'resume_id': resume_id,
@@ -175,55 +340,59 @@ def get_resumes():
     """Get all resumes - only from current user's session"""
     try:
         user_id = session.get('user_id')
-        
-        # Get only resumes uploaded by current user
+
+        # Pagination (bounded so a single request can't materialize the table)
+        try:
+            limit = min(max(int(request.args.get('limit', 100)), 1), 100)
+            page = max(int(request.args.get('page', 1)), 1)
+        except ValueError:
+            return jsonify({'error': 'Invalid pagination parameters'}), 400
+        offset = (page - 1) * limit
+
+        # Project only the columns the listing returns; the experience and
+        # education JSON blobs are never part of this response, so they are
+        # neither fetched nor decoded
         conn = db.get_connection()
         cursor = conn.cursor()
         cursor.execute('''
-            SELECT * FROM resumes 
-            WHERE uploaded_by = ? 
-            ORDER BY uploaded_at DESC 
-            LIMIT 100
-        ''', (user_id,))
+            SELECT id, candidate_name, email, phone, skills, uploaded_at
+            FROM resumes
+            WHERE uploaded_by = ?
+            ORDER BY uploaded_at DESC
+            LIMIT ? OFFSET ?
+        ''', (user_id, limit, offset))
         resumes = cursor.fetchall()
-        conn.close()
-        
-        result = []
-        for resume in resumes:
-            resume_dict = dict(resume)
-            resume_dict['skills'] = json.loads(resume_dict['skills']) if resume_dict['skills'] else []
-            resume_dict['experience'] = json.loads(resume_dict['experience']) if resume_dict['experience'] else []
-            resume_dict['education'] = json.loads(resume_dict['education']) if resume_dict['education'] else []
-            result.append(resume_dict)
-        
+
         # Check if request is from database dashboard (expects plain array)
         if request.args.get('format') == 'simple':
             simplified_resumes = []
-            for resume in result:
+            for resume in resumes:
+                skills = _json_loads(resume['skills']) if resume['skills'] else []
                 simplified_resumes.append({
                     'id': resume['id'],
                     'candidate_name': resume['candidate_name'] or 'N/A',
                     'email': resume['email'] or 'N/A',
                     'phone': resume['phone'] or 'N/A',
-                    'skills': resume['skills'][:10] if resume['skills'] else [],
+                    'skills': skills[:10],
                     'uploaded_at': resume['uploaded_at']
                 })
-            return jsonify(simplified_resumes), 200
-        
+            return ojsonify(simplified_resumes), 200
+
         # Original format for main dashboard
         simplified_resumes = []
-        for resume in result:
+        for resume in resumes:
+            skills = _json_loads(resume['skills']) if resume['skills'] else []
             simplified_resumes.append({
                 'id': resume['id'],
                 'candidate_name': resume['candidate_name'],
                 'email': resume['email'],
                 'phone': resume['phone'],
-                'skills': resume['skills'][:10] if resume['skills'] else [],
+                'skills': skills[:10],
                 'uploaded_at': resume['uploaded_at']
             })
-        
-        return jsonify({'resumes': simplified_resumes}), 200
-        
+
+        return ojsonify({'resumes': simplified_resumes}), 200
+
     except Exception as e:
         print(f"Error fetching resumes: {str(e)}")
         return jsonify({'error': f'Failed to fetch resumes: {str(e)}'}), 500
@@ -248,18 +417,16 @@ def get_resume(resume_id):
 def delete_resume(resume_id):
     """Delete a resume"""
     try:
-        resume = db.get_resume(resume_id)
-        
-        if not resume:
-            return jsonify({'error': 'Resume not found'}), 404
-        
-        # Delete from database
+        # Delete directly; rowcount tells us whether the resume existed,
+        # saving the SELECT round-trip
         conn = db.get_connection()
         cursor = conn.cursor()
         cursor.execute('DELETE FROM resumes WHERE id = ?', (resume_id,))
         conn.commit()
-        conn.close()
-        
+
+        if cursor.rowcount == 0:
+            return jsonify({'error': 'Resume not found'}), 404
+
         return jsonify({'message': 'Resume deleted successfully'}), 200
         
     except Exception as e:
@@ -350,18 +517,15 @@ def get_job(job_id):
 def delete_job(job_id):
     """Delete a job description"""
     try:
-        job = db.get_job_description(job_id)
-        
-        if not job:
-            return jsonify({'error': 'Job not found'}), 404
-        
-        # Delete from database
+        # Delete directly; rowcount tells us whether the job existed
         conn = db.get_connection()
         cursor = conn.cursor()
         cursor.execute('DELETE FROM job_descriptions WHERE id = ?', (job_id,))
         conn.commit()
-        conn.close()
-        
+
+        if cursor.rowcount == 0:
+            return jsonify({'error': 'Job not found'}), 404
+
         return jsonify({'message': 'Job deleted successfully'}), 200
         
     except Exception as e:
@@ -388,35 +552,89 @@ def match_candidates():
         if not job:
             return jsonify({'error': 'Job not found'}), 404
         
-        # Get resumes to match
+        # Get resumes to match (single query instead of one per id)
         if resume_ids:
-            resumes = [db.get_resume(rid) for rid in resume_ids]
-            resumes = [r for r in resumes if r]  # Filter None values
+            resumes = db.get_resumes_by_ids(resume_ids)
         else:
             resumes = db.get_all_resumes()
         
         if not resumes:
             return jsonify({'error': 'No resumes found'}), 404
-        
-        # Perform matching
-        match_results = llm_matcher.batch_match_resumes(resumes, job)
-        
-        # Save match results to database
-        for match in match_results:
-            match_data = {
-                'resume_id': match['resume_id'],
-                'job_id': job_id,
-                'match_score': match['match_score'],
-                'justification': match['justification'],
-                'matched_skills': match['matched_skills'],
-                'missing_skills': match['missing_skills'],
-                'overall_assessment': match['overall_assessment']
-            }
-            db.save_match_result(match_data)
-        
-        return jsonify({
+
+        # Cheap lexical pre-filter so huge corpora don't all reach the
+        # LLM. Skipped when the client picked specific resumes — an
+        # explicit list must be scored in full — and the response reports
+        # how many candidates were cut so the ranking is never silent
+        prefiltered_out = 0
+        if not resume_ids:
+            try:
+                top_k = int(data.get('top_k') or 50)
+            except (TypeError, ValueError):
+                return jsonify({'error': 'Invalid top_k parameter'}), 400
+            kept = llm_matcher.prefilter_resumes(resumes, job, top_k=top_k)
+            prefiltered_out = len(resumes) - len(kept)
+            resumes = kept
+        
+        # Serve repeat resume x job pairs from cache (memory first, then the
+        # match_results table) instead of re-running the LLM
+        cached_results = []
+        to_match = []
+        signatures = {resume.get('id'): llm_matcher.prompt_signature(resume, job)
+                      for resume in resumes}
+        for resume in resumes:
+            key = (resume.get('id'), job_id)
+            cached = _match_cache_get(key)
+            if cached is None:
+                # Pair lookup first, then the content hash, which also hits
+                # when the same resume content exists under another id
+                stored = db.get_match_result(resume.get('id'), job_id)
+                if stored is None:
+                    stored = db.get_match_by_prompt_hash(signatures[resume.get('id')])
+                if stored:
+                    cached = {
+                        'resume_id': resume.get('id'),
+                        'candidate_name': resume.get('candidate_name', 'Unknown'),
+                        'email': resume.get('email'),
+                        'match_score': stored['match_score'],
+                        'justification': stored['justification'],
+                        'matched_skills': stored['matched_skills'],
+                        'missing_skills': stored['missing_skills'],
+                        'overall_assessment': stored['overall_assessment'],
+                        # legacy rows predate the recommendation column
+                        'recommendation': stored.get('recommendation') or 'Consider'
+                    }
+                    _match_cache_put(key, cached)
+            if cached is not None:
+                cached_results.append(dict(cached))
+            else:
+                to_match.append(resume)
+
+        # Perform matching - batch_match_resumes fans out across a thread
+        # pool so the batch overlaps LLM round-trips instead of serializing
+        # bulk=True shares one prompt per chunk of candidates, amortizing
+        # the job-description tokens across the batch
+        new_results = llm_matcher.batch_match_resumes(
+            to_match, job, bulk=bool(data.get('bulk')))
+        for match_result in new_results:
+            match_result['prompt_hash'] = signatures.get(match_result['resume_id'])
+
+        # Save only the freshly computed results in one transaction
+        db.save_match_results_bulk(new_results, job_id)
+
+        # prompt_hash is an internal cache key; strip it before results
+        # reach the in-memory cache or the response
+        for match_result in new_results:
+            match_result.pop('prompt_hash', None)
+            _match_cache_put((match_result['resume_id'], job_id), match_result)
+
+        # Sort by match score (descending)
+        match_results = cached_results + new_results
+        match_results.sort(key=lambda x: x['match_score'], reverse=True)
+        
+        return ojsonify({
             'message': 'Matching completed successfully',
             'total_candidates': len(match_results),
+            'prefiltered_out': prefiltered_out,
             'results': match_results
         }), 200
         
@@ -430,7 +648,7 @@ def get_matches(job_id):
     """Get match results for a job"""
     try:
         matches = db.get_matches_for_job(job_id)
-        return jsonify({'matches': matches}), 200
+        return ojsonify({'matches': matches}), 200
     except Exception as e:
         return jsonify({'error': f'Failed to fetch matches: {str(e)}'}), 500
 
@@ -439,26 +657,37 @@ def get_matches(job_id):
 def get_all_matches():
     """Get all match results"""
     try:
+        try:
+            limit = min(max(int(request.args.get('limit', 100)), 1), 100)
+            page = max(int(request.args.get('page', 1)), 1)
+        except ValueError:
+            return jsonify({'error': 'Invalid pagination parameters'}), 400
+        offset = (page - 1) * limit
+
         conn = db.get_connection()
         cursor = conn.cursor()
+        # explicit columns keep the internal prompt_hash out of the response
         cursor.execute('''
-            SELECT mr.*, r.candidate_name, r.email, r.phone
+            SELECT mr.id, mr.resume_id, mr.job_id, mr.match_score,
+                   mr.justification, mr.matched_skills, mr.missing_skills,
+                   mr.overall_assessment, mr.recommendation, mr.created_at,
+                   r.candidate_name, r.email, r.phone
             FROM match_results mr
             JOIN resumes r ON mr.resume_id = r.id
             ORDER BY mr.created_at DESC
-            LIMIT 100
-        ''')
+            LIMIT ? OFFSET ?
+        ''', (limit, offset))
         matches = cursor.fetchall()
-        conn.close()
         
         result = []
         for match in matches:
             match_dict = dict(match)
-            match_dict['matched_skills'] = json.loads(match_dict['matched_skills']) if match_dict['matched_skills'] else []
-            match_dict['missing_skills'] = json.loads(match_dict['missing_skills']) if match_dict['missing_skills'] else []
+            match_dict['justification'] = decompress_text(match_dict['justification'])
+            match_dict['matched_skills'] = _json_loads(match_dict['matched_skills']) if match_dict['matched_skills'] else []
+            match_dict['missing_skills'] = _json_loads(match_dict['missing_skills']) if match_dict['missing_skills'] else []
             result.append(match_dict)
         
-        return jsonify(result), 200
+        return ojsonify(result), 200
     except Exception as e:
         return jsonify({'error': f'Failed to fetch matches: {str(e)}'}), 500
 
@@ -484,8 +713,16 @@ def not_found(error):
 def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
+# Production entrypoint: the app is served by Gunicorn (see README), e.g.
+#   gunicorn -w 4 -k gthread --threads 4 --timeout 120 -b 0.0.0.0:5000 app:app
+# Do NOT use --preload: importing this module opens a SQLite connection
+# (db.create_tables) and a pooled keep-alive socket to Ollama
+# (LLMMatcher), and neither survives fork() safely — SQLite forbids
+# sharing a connection across fork, and workers would interleave requests
+# on one inherited socket. Each worker must import the app itself.
 if __name__ == '__main__':
-    print("Starting Smart Resume Screener...")
+    # Local development only - use Gunicorn in production
+    print("Starting Smart Resume Screener (dev server)...")
     print("Make sure Ollama is running: ollama serve")
     print("\nAvailable routes:")
     print("- Login: http://localhost:5000/")
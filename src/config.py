@@ -1,27 +1,38 @@
 # src/config.py
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables (read once at import; values below are
+# parsed into typed constants so hot paths never re-read the environment)
 load_dotenv()
 
+def _as_bool(value, default):
+    """Parse an environment flag into a real boolean, once, at import"""
+    return str(value if value is not None else default).lower() in ('1', 'true', 'yes', 'on')
+
 class Config:
     # Flask settings
     SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key-change-in-production')
-    DEBUG = os.getenv('DEBUG', 'True') == 'True'
-    
+    DEBUG = _as_bool(os.getenv('DEBUG'), 'True')
+
     # Database settings
-    DATABASE_PATH = os.getenv('DATABASE_PATH', 'database/resume_screener.db')
-    
+    DATABASE_PATH = Path(os.getenv('DATABASE_PATH', 'database/resume_screener.db'))
+
     # Upload settings
-    UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
+    UPLOAD_FOLDER = Path(os.getenv('UPLOAD_FOLDER', 'uploads'))
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
-    ALLOWED_EXTENSIONS = {'pdf', 'docx'}
-    
+    ALLOWED_EXTENSIONS = frozenset(('pdf', 'docx'))
+
     # LLM settings
-    USE_GEMINI = os.getenv('USE_GEMINI', 'False') == 'True'
+    USE_GEMINI = _as_bool(os.getenv('USE_GEMINI'), 'False')
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', None)
-    OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'llama3.2:3b')
+    # Q4_K_M quantization roughly halves model memory vs Q8 and gives
+    # ~1.5-2x token throughput at negligible quality loss for scoring
+    OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'llama3.2:3b-instruct-q4_K_M')
+    # Concurrent LLM calls per batch; keep in line with Ollama's
+    # OLLAMA_NUM_PARALLEL so requests overlap instead of queueing
+    LLM_MATCH_WORKERS = int(os.getenv('LLM_MATCH_WORKERS', 8))
     
     # Server settings
     HOST = os.getenv('HOST', '0.0.0.0')
@@ -35,7 +46,8 @@ DATABASE_PATH=database/resume_screener.db
 UPLOAD_FOLDER=uploads
 USE_GEMINI=False
 GEMINI_API_KEY=your-gemini-api-key-here
-OLLAMA_MODEL=llama3.2:3b
+OLLAMA_MODEL=llama3.2:3b-instruct-q4_K_M
+LLM_MATCH_WORKERS=8
 HOST=0.0.0.0
 PORT=5000
 """
\ No newline at end of file
@@ -1,27 +1,274 @@
 # src/database.py
 import sqlite3
 import json
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+# Optional: orjson for the JSON columns (skills/experience/education and
+# match skill lists) — ~5x faster than stdlib json on these hot paths
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_dumps(obj):
+    """Serialize a JSON column value; orjson when available"""
+    if ORJSON_AVAILABLE:
+        # decode to str so the column keeps TEXT affinity (SQLite's JSON1
+        # functions reject raw BLOBs)
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def _maybe_json(value):
+    """Serialize for a JSON column unless the caller already did.
+
+    LLM JSON mode and API clients sometimes hand these fields over as
+    ready-made JSON strings; re-parsing and re-encoding them would be two
+    wasted passes, so str/bytes pass straight through.
+    """
+    if isinstance(value, (str, bytes)):
+        return value
+    return _json_dumps(value)
+
+def _json_loads(value):
+    """Deserialize a JSON column value; orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+# Optional: zstd-compress the large text columns (resume raw text, LLM
+# justifications) so they cost a fraction of the page I/O on reads
+try:
+    import zstandard as zstd
+    _zstd_compress = zstd.ZstdCompressor(level=3)
+    _zstd_decompress = zstd.ZstdDecompressor()
+    _zstd_lock = threading.Lock()
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Fixed SQL for the hot paths lives in module-level constants so every call
+# passes the identical statement text; sqlite3's per-connection statement
+# cache (sized via cached_statements in get_connection) then reuses the
+# prepared statement instead of re-parsing the SQL each time.
+
+# SQLite 3.35+ hands the new id back from the INSERT itself instead of a
+# separate lastrowid read; older builds fall back to lastrowid
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_RETURNING_ID = ' RETURNING id' if _HAS_RETURNING else ''
+
+_SQL_INSERT_USER = '''
+    INSERT INTO users (username, password_hash, email, role)
+    VALUES (?, ?, ?, ?)
+''' + _RETURNING_ID
+
+_SQL_GET_USER = 'SELECT * FROM users WHERE username = ?'
+
+_SQL_INSERT_RESUME = '''
+    INSERT INTO resumes (
+        candidate_name, email, phone, file_path, raw_text,
+        skills, experience, education, parsed_data, uploaded_by
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+''' + _RETURNING_ID
+
+_SQL_GET_RESUME = 'SELECT * FROM resumes WHERE id = ?'
+
+_SQL_GET_RESUME_ID_BY_PATH = '''
+    SELECT id FROM resumes WHERE file_path = ? AND uploaded_by = ? LIMIT 1
+'''
+
+# Column whitelists for the projected listing queries; anything outside
+# these is silently dropped rather than interpolated into SQL
+_RESUME_COLUMNS = frozenset((
+    'id', 'candidate_name', 'email', 'phone', 'file_path', 'raw_text',
+    'skills', 'experience', 'education', 'parsed_data', 'uploaded_at',
+    'uploaded_by'
+))
+
+_JOB_COLUMNS = frozenset((
+    'id', 'job_title', 'company_name', 'required_skills',
+    'experience_required', 'education_required', 'job_description',
+    'created_at', 'created_by'
+))
+
+_JSON_COLUMNS = frozenset((
+    'skills', 'experience', 'education', 'parsed_data', 'required_skills'
+))
+
+_SQL_INSERT_JOB = '''
+    INSERT INTO job_descriptions (
+        job_title, company_name, required_skills, experience_required,
+        education_required, job_description, created_by
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+''' + _RETURNING_ID
+
+_SQL_GET_JOB = 'SELECT * FROM job_descriptions WHERE id = ?'
+
+# executemany cannot run statements that return rows, so the bulk writer
+# keeps the RETURNING-free form
+_SQL_INSERT_MATCH_BULK = '''
+    INSERT OR IGNORE INTO match_results (
+        resume_id, job_id, match_score, justification,
+        matched_skills, missing_skills, overall_assessment,
+        recommendation, prompt_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_MATCH = _SQL_INSERT_MATCH_BULK + _RETURNING_ID
+
+_SQL_GET_MATCH_BY_HASH = 'SELECT * FROM match_results WHERE prompt_hash = ? LIMIT 1'
+
+_SQL_GET_MATCH_PAIR = '''
+    SELECT * FROM match_results
+    WHERE resume_id = ? AND job_id = ?
+    ORDER BY created_at DESC LIMIT 1
+'''
+
+_SQL_GET_STATISTICS = '''
+    SELECT (SELECT COUNT(*) FROM resumes) AS total_resumes,
+           (SELECT COUNT(*) FROM job_descriptions) AS total_jobs,
+           (SELECT COUNT(*) FROM match_results) AS total_matches,
+           (SELECT AVG(match_score) FROM match_results) AS avg_score
+'''
+
+# prompt_hash is an internal cache key and stays out of everything
+# listing endpoints serve to clients
+_SQL_GET_MATCHES_FOR_JOB = '''
+    SELECT mr.id, mr.resume_id, mr.job_id, mr.match_score, mr.justification,
+           mr.matched_skills, mr.missing_skills, mr.overall_assessment,
+           mr.recommendation, mr.created_at,
+           r.candidate_name, r.email, r.phone
+    FROM match_results mr
+    JOIN resumes r ON mr.resume_id = r.id
+    WHERE mr.job_id = ?
+    ORDER BY mr.match_score DESC
+'''
+
+def compress_text(text):
+    """Compress a large text value to a zstd BLOB; no-op without zstandard"""
+    if not ZSTD_AVAILABLE or text is None:
+        return text
+    with _zstd_lock:
+        return _zstd_compress.compress(text.encode('utf-8'))
+
+def decompress_text(value):
+    """Decompress a zstd BLOB back to str; plain TEXT passes through"""
+    if ZSTD_AVAILABLE and isinstance(value, bytes) and value[:4] == _ZSTD_MAGIC:
+        with _zstd_lock:
+            return _zstd_decompress.decompress(value).decode('utf-8')
+    return value
+
+# Fields that need a decode step when read off a match_results row
+_MATCH_JSON_FIELDS = ('matched_skills', 'missing_skills')
+
+class MatchRow:
+    """Lazy view over one match_results row (plus joined resume columns).
+
+    Field access decodes JSON lists and the compressed justification on
+    first touch and caches the result, so scans that only look at e.g.
+    match_score never pay for decoding the rest.
+    """
+    __slots__ = ('_row', '_cache')
+
+    def __init__(self, row: sqlite3.Row):
+        self._row = row
+        self._cache = {}
+
+    def __getitem__(self, key):
+        cache = self._cache
+        if key in cache:
+            return cache[key]
+        value = self._row[key]
+        if key in _MATCH_JSON_FIELDS:
+            value = _json_loads(value) if value else []
+        elif key == 'justification':
+            value = decompress_text(value)
+        cache[key] = value
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except (IndexError, KeyError):
+            return default
+
+    def keys(self):
+        return self._row.keys()
+
+    def to_dict(self) -> Dict:
+        return {key: self[key] for key in self._row.keys()}
+
 
 class Database:
     def __init__(self, db_path='database/resume_screener.db'):
         self.db_path = db_path
+        self._local = threading.local()
+        self._stats_cache = None
         self.create_tables()
-    
+
     def get_connection(self):
-        """Create database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get the persistent per-thread database connection.
+
+        Opening/closing a connection per query pays filesystem and page-cache
+        setup costs on every call, so each thread lazily opens one connection,
+        tunes it once, and reuses it for all subsequent queries.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # cached_statements sized to comfortably hold every statement
+            # this app issues, so prepared statements are reused across calls
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            # One-time tuning: WAL allows concurrent readers during writes,
+            # NORMAL sync is safe with WAL and avoids an fsync per commit.
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-65536')
+            self._local.conn = conn
         return conn
+
+    def _exec(self, sql: str, params=()):
+        """Execute one of the module-level SQL constants and return the cursor.
+
+        Routing every query through here keeps the statement text identical
+        call-to-call, which is what lets the connection's statement cache
+        skip the SQL re-parse. Connection.execute is the documented
+        shortcut that also skips an explicit cursor allocation per call.
+        """
+        return self.get_connection().execute(sql, params)
+
+    def _insert_id(self, sql: str, params) -> Optional[int]:
+        """Run an INSERT and return the new row id.
+
+        On SQLite 3.35+ the id comes straight back via RETURNING (None if
+        an OR IGNORE insert matched an existing row); older builds read
+        lastrowid.
+        """
+        cursor = self._exec(sql, params)
+        if _HAS_RETURNING:
+            row = cursor.fetchone()
+            return row[0] if row else None
+        return cursor.lastrowid
+
+    def close(self):
+        """Close the current thread's connection (worker shutdown)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
     
     def create_tables(self):
         """Create necessary database tables"""
         conn = self.get_connection()
-        cursor = conn.cursor()
         
         # Users table
-        cursor.execute('''
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
@@ -33,7 +280,7 @@ class Database:
         ''')
         
         # Resumes table
-        cursor.execute('''
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS resumes (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 candidate_name TEXT,
@@ -52,7 +299,7 @@ class Database:
         ''')
         
         # Job Descriptions table
-        cursor.execute('''
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS job_descriptions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 job_title TEXT NOT NULL,
@@ -68,7 +315,7 @@ class Database:
         ''')
         
         # Match Results table
-        cursor.execute('''
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS match_results (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 resume_id INTEGER NOT NULL,
@@ -78,228 +325,357 @@ class Database:
                 matched_skills TEXT,
                 missing_skills TEXT,
                 overall_assessment TEXT,
+                recommendation TEXT,
+                prompt_hash TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (resume_id) REFERENCES resumes(id),
                 FOREIGN KEY (job_id) REFERENCES job_descriptions(id)
             )
         ''')
         
+        # Composite indexes for the hot listing queries: per-user resume
+        # listings and recent matches per job become index range scans
+        # instead of full scans + sorts
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_resumes_user_time
+            ON resumes(uploaded_by, uploaded_at DESC)
+        ''')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_matches_job_time
+            ON match_results(job_id, created_at DESC)
+        ''')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_matches_resume
+            ON match_results(resume_id)
+        ''')
+        # Ranked-results and recency listings order by these columns, so
+        # give each its index and the sorts become index walks
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_mr_job_score
+            ON match_results(job_id, match_score DESC)
+        ''')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_resumes_uploaded
+            ON resumes(uploaded_at DESC)
+        ''')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_jobs_created
+            ON job_descriptions(created_at DESC)
+        ''')
+        # Content-addressed match cache: the hash of the inputs that decide
+        # a match outcome, unique so identical evaluations store once.
+        # SQLite allows many NULLs in a unique index, so legacy rows are fine.
+        try:
+            conn.execute('ALTER TABLE match_results ADD COLUMN prompt_hash TEXT')
+        except sqlite3.OperationalError:
+            pass  # column already present on an existing database
+        # Persist the recommendation so cache-served matches carry the
+        # same fields as freshly scored ones
+        try:
+            conn.execute('ALTER TABLE match_results ADD COLUMN recommendation TEXT')
+        except sqlite3.OperationalError:
+            pass  # column already present on an existing database
+        conn.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_mr_prompt_hash
+            ON match_results(prompt_hash)
+        ''')
+
         conn.commit()
-        conn.close()
-    
+
     # User operations
     def create_user(self, username: str, password_hash: str, email: str = None, role: str = 'user'):
         """Create a new user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute('''
-                INSERT INTO users (username, password_hash, email, role)
-                VALUES (?, ?, ?, ?)
-            ''', (username, password_hash, email, role))
-            conn.commit()
-            return cursor.lastrowid
+            user_id = self._insert_id(_SQL_INSERT_USER, (username, password_hash, email, role))
+            self.get_connection().commit()
+            return user_id
         except sqlite3.IntegrityError:
             return None
-        finally:
-            conn.close()
     
     def get_user_by_username(self, username: str):
         """Get user by username"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM users WHERE username = ?', (username,))
-        user = cursor.fetchone()
-        conn.close()
+        user = self._exec(_SQL_GET_USER, (username,)).fetchone()
         return dict(user) if user else None
     
     # Resume operations
     def save_resume(self, resume_data: Dict, user_id: int = None) -> int:
         """Save parsed resume to database"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO resumes (
-                candidate_name, email, phone, file_path, raw_text,
-                skills, experience, education, parsed_data, uploaded_by
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        resume_id = self._insert_id(_SQL_INSERT_RESUME, (
             resume_data.get('candidate_name'),
             resume_data.get('email'),
             resume_data.get('phone'),
             resume_data.get('file_path'),
-            resume_data.get('raw_text'),
-            json.dumps(resume_data.get('skills', [])),
-            json.dumps(resume_data.get('experience', [])),
-            json.dumps(resume_data.get('education', [])),
-            json.dumps(resume_data.get('parsed_data', {})),
+            compress_text(resume_data.get('raw_text')),
+            _maybe_json(resume_data.get('skills', [])),
+            _maybe_json(resume_data.get('experience', [])),
+            _maybe_json(resume_data.get('education', [])),
+            _maybe_json(resume_data.get('parsed_data', {})),
             user_id
         ))
-        
-        conn.commit()
-        resume_id = cursor.lastrowid
-        conn.close()
+
+        self.get_connection().commit()
         return resume_id
     
+    def save_resumes_bulk(self, resumes: List[Dict], user_id: int = None) -> List[int]:
+        """Save a batch of parsed resumes in one transaction.
+
+        Mirrors save_match_results_bulk: a single commit amortizes the fsync
+        across the whole batch, and the cached prepared statement is reused
+        row to row. Returns the new resume ids in input order (executemany
+        would be marginally faster but loses lastrowid, which callers need).
+        """
+        if not resumes:
+            return []
+
+        rows = [
+            (
+                resume_data.get('candidate_name'),
+                resume_data.get('email'),
+                resume_data.get('phone'),
+                resume_data.get('file_path'),
+                compress_text(resume_data.get('raw_text')),
+                _maybe_json(resume_data.get('skills', [])),
+                _maybe_json(resume_data.get('experience', [])),
+                _maybe_json(resume_data.get('education', [])),
+                _maybe_json(resume_data.get('parsed_data', {})),
+                user_id
+            )
+            for resume_data in resumes
+        ]
+
+        conn = self.get_connection()
+        resume_ids = [self._insert_id(_SQL_INSERT_RESUME, row) for row in rows]
+        conn.commit()
+        return resume_ids
+
+    def get_resume_id_by_file_path(self, file_path: str, user_id: int) -> Optional[int]:
+        """Get the user's resume id for a stored file path, if any.
+
+        Scoped per user: another user uploading byte-identical content
+        shares the file on disk but keeps their own resume row.
+        """
+        row = self._exec(_SQL_GET_RESUME_ID_BY_PATH, (file_path, user_id)).fetchone()
+        return row['id'] if row else None
+
     def get_resume(self, resume_id: int) -> Optional[Dict]:
         """Get resume by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM resumes WHERE id = ?', (resume_id,))
-        resume = cursor.fetchone()
-        conn.close()
+        resume = self._exec(_SQL_GET_RESUME, (resume_id,)).fetchone()
         
         if resume:
             resume_dict = dict(resume)
+            resume_dict['raw_text'] = decompress_text(resume_dict['raw_text'])
             # Parse JSON fields
-            resume_dict['skills'] = json.loads(resume_dict['skills']) if resume_dict['skills'] else []
-            resume_dict['experience'] = json.loads(resume_dict['experience']) if resume_dict['experience'] else []
-            resume_dict['education'] = json.loads(resume_dict['education']) if resume_dict['education'] else []
+            resume_dict['skills'] = _json_loads(resume_dict['skills']) if resume_dict['skills'] else []
+            resume_dict['experience'] = _json_loads(resume_dict['experience']) if resume_dict['experience'] else []
+            resume_dict['education'] = _json_loads(resume_dict['education']) if resume_dict['education'] else []
             return resume_dict
         return None
     
-    def get_all_resumes(self, limit: int = 100) -> List[Dict]:
-        """Get all resumes"""
+    def get_resumes_by_ids(self, resume_ids: List[int]) -> List[Dict]:
+        """Get multiple resumes in a single query, preserving input order"""
+        if not resume_ids:
+            return []
+
         conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM resumes ORDER BY uploaded_at DESC LIMIT ?', (limit,))
-        resumes = cursor.fetchall()
-        conn.close()
-        
+        placeholders = ','.join('?' * len(resume_ids))
+        rows = conn.execute(f'SELECT * FROM resumes WHERE id IN ({placeholders})',
+                            resume_ids).fetchall()
+
+        by_id = {}
+        for row in rows:
+            resume_dict = dict(row)
+            resume_dict['raw_text'] = decompress_text(resume_dict['raw_text'])
+            resume_dict['skills'] = _json_loads(resume_dict['skills']) if resume_dict['skills'] else []
+            resume_dict['experience'] = _json_loads(resume_dict['experience']) if resume_dict['experience'] else []
+            resume_dict['education'] = _json_loads(resume_dict['education']) if resume_dict['education'] else []
+            by_id[resume_dict['id']] = resume_dict
+
+        # Re-index so callers get results in the order they asked for
+        return [by_id[rid] for rid in resume_ids if rid in by_id]
+
+    def get_all_resumes(self, limit: int = 100,
+                        columns=('id', 'candidate_name', 'email', 'phone',
+                                 'uploaded_at', 'skills')) -> List[Dict]:
+        """Get recent resumes, projecting only the requested columns.
+
+        raw_text and parsed_data can run to many KB per row, so the default
+        projection ships just what the listing UI and matcher consume;
+        callers that need the heavy columns ask for them explicitly.
+        """
+        selected = [c for c in columns if c in _RESUME_COLUMNS]
+        sql = f'SELECT {", ".join(selected)} FROM resumes ORDER BY uploaded_at DESC LIMIT ?'
+        resumes = self._exec(sql, (limit,)).fetchall()
+
+        json_cols = [c for c in selected if c in _JSON_COLUMNS]
         result = []
         for resume in resumes:
             resume_dict = dict(resume)
-            resume_dict['skills'] = json.loads(resume_dict['skills']) if resume_dict['skills'] else []
+            if 'raw_text' in resume_dict:
+                resume_dict['raw_text'] = decompress_text(resume_dict['raw_text'])
+            for col in json_cols:
+                resume_dict[col] = _json_loads(resume_dict[col]) if resume_dict[col] else []
             result.append(resume_dict)
         return result
     
     # Job Description operations
     def save_job_description(self, job_data: Dict, user_id: int = None) -> int:
         """Save job description to database"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO job_descriptions (
-                job_title, company_name, required_skills, experience_required,
-                education_required, job_description, created_by
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        job_id = self._insert_id(_SQL_INSERT_JOB, (
             job_data.get('job_title'),
             job_data.get('company_name'),
-            json.dumps(job_data.get('required_skills', [])),
+            _maybe_json(job_data.get('required_skills', [])),
             job_data.get('experience_required'),
             job_data.get('education_required'),
             job_data.get('job_description'),
             user_id
         ))
-        
-        conn.commit()
-        job_id = cursor.lastrowid
-        conn.close()
+
+        self.get_connection().commit()
         return job_id
     
     def get_job_description(self, job_id: int) -> Optional[Dict]:
         """Get job description by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM job_descriptions WHERE id = ?', (job_id,))
-        job = cursor.fetchone()
-        conn.close()
+        job = self._exec(_SQL_GET_JOB, (job_id,)).fetchone()
         
         if job:
             job_dict = dict(job)
-            job_dict['required_skills'] = json.loads(job_dict['required_skills']) if job_dict['required_skills'] else []
+            job_dict['required_skills'] = _json_loads(job_dict['required_skills']) if job_dict['required_skills'] else []
             return job_dict
         return None
     
-    def get_all_jobs(self, limit: int = 50) -> List[Dict]:
-        """Get all job descriptions"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM job_descriptions ORDER BY created_at DESC LIMIT ?', (limit,))
-        jobs = cursor.fetchall()
-        conn.close()
-        
+    def get_all_jobs(self, limit: int = 50,
+                     columns=('id', 'job_title', 'company_name', 'required_skills',
+                              'experience_required', 'education_required',
+                              'created_at')) -> List[Dict]:
+        """Get recent job descriptions, projecting only the requested columns.
+
+        The full job_description text is excluded by default — the listing
+        UI never renders it, and it dominates the bytes per row.
+        """
+        selected = [c for c in columns if c in _JOB_COLUMNS]
+        sql = f'SELECT {", ".join(selected)} FROM job_descriptions ORDER BY created_at DESC LIMIT ?'
+        jobs = self._exec(sql, (limit,)).fetchall()
+
         result = []
         for job in jobs:
             job_dict = dict(job)
-            job_dict['required_skills'] = json.loads(job_dict['required_skills']) if job_dict['required_skills'] else []
+            if 'required_skills' in job_dict:
+                job_dict['required_skills'] = _json_loads(job_dict['required_skills']) if job_dict['required_skills'] else []
             result.append(job_dict)
         return result
     
     # Match Results operations
     def save_match_result(self, match_data: Dict) -> int:
         """Save matching result"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO match_results (
-                resume_id, job_id, match_score, justification,
-                matched_skills, missing_skills, overall_assessment
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        match_id = self._insert_id(_SQL_INSERT_MATCH, (
             match_data.get('resume_id'),
             match_data.get('job_id'),
             match_data.get('match_score'),
-            match_data.get('justification'),
-            json.dumps(match_data.get('matched_skills', [])),
-            json.dumps(match_data.get('missing_skills', [])),
-            match_data.get('overall_assessment')
+            compress_text(match_data.get('justification')),
+            _maybe_json(match_data.get('matched_skills', [])),
+            _maybe_json(match_data.get('missing_skills', [])),
+            match_data.get('overall_assessment'),
+            match_data.get('recommendation'),
+            match_data.get('prompt_hash')
         ))
-        
-        conn.commit()
-        match_id = cursor.lastrowid
-        conn.close()
+
+        self.get_connection().commit()
         return match_id
     
-    def get_matches_for_job(self, job_id: int) -> List[Dict]:
-        """Get all match results for a specific job"""
+    def save_match_results_bulk(self, match_results: List[Dict], job_id: int) -> int:
+        """Save a batch of match results in one transaction.
+
+        One executemany + commit costs a single statement prepare and a
+        single fsync for the whole batch, instead of one per match.
+        """
+        if not match_results:
+            return 0
+
+        rows = [
+            (
+                match.get('resume_id'),
+                job_id,
+                match.get('match_score'),
+                compress_text(match.get('justification')),
+                _maybe_json(match.get('matched_skills', [])),
+                _maybe_json(match.get('missing_skills', [])),
+                match.get('overall_assessment'),
+                match.get('recommendation'),
+                match.get('prompt_hash')
+            )
+            for match in match_results
+        ]
+
         conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT mr.*, r.candidate_name, r.email, r.phone
-            FROM match_results mr
-            JOIN resumes r ON mr.resume_id = r.id
-            WHERE mr.job_id = ?
-            ORDER BY mr.match_score DESC
-        ''', (job_id,))
-        matches = cursor.fetchall()
-        conn.close()
-        
-        result = []
-        for match in matches:
+        cursor = conn.executemany(_SQL_INSERT_MATCH_BULK, rows)
+        conn.commit()
+        # rowcount excludes rows skipped by OR IGNORE, so callers see how
+        # many results were actually stored
+        return cursor.rowcount
+
+    def get_match_result(self, resume_id: int, job_id: int) -> Optional[Dict]:
+        """Get the most recent stored match for a resume/job pair"""
+        match = self._exec(_SQL_GET_MATCH_PAIR, (resume_id, job_id)).fetchone()
+
+        if match:
             match_dict = dict(match)
-            match_dict['matched_skills'] = json.loads(match_dict['matched_skills']) if match_dict['matched_skills'] else []
-            match_dict['missing_skills'] = json.loads(match_dict['missing_skills']) if match_dict['missing_skills'] else []
-            result.append(match_dict)
-        return result
+            match_dict['justification'] = decompress_text(match_dict['justification'])
+            match_dict['matched_skills'] = _json_loads(match_dict['matched_skills']) if match_dict['matched_skills'] else []
+            match_dict['missing_skills'] = _json_loads(match_dict['missing_skills']) if match_dict['missing_skills'] else []
+            return match_dict
+        return None
+
+    def get_match_by_prompt_hash(self, prompt_hash: str) -> Optional[Dict]:
+        """Get a stored match by its content hash.
+
+        The hash covers the resume identity plus the content that decides
+        the outcome, so this hits when the same candidate/job content was
+        already evaluated — e.g. under a different job id with an
+        identical description — and an LLM call is orders of magnitude
+        more expensive than this lookup.
+        """
+        if not prompt_hash:
+            return None
+        match = self._exec(_SQL_GET_MATCH_BY_HASH, (prompt_hash,)).fetchone()
+
+        if match:
+            match_dict = dict(match)
+            match_dict['justification'] = decompress_text(match_dict['justification'])
+            match_dict['matched_skills'] = _json_loads(match_dict['matched_skills']) if match_dict['matched_skills'] else []
+            match_dict['missing_skills'] = _json_loads(match_dict['missing_skills']) if match_dict['missing_skills'] else []
+            return match_dict
+        return None
+
+    def iter_matches_for_job(self, job_id: int) -> Iterator[MatchRow]:
+        """Stream a job's matches as lazy MatchRow views.
+
+        Nothing is decoded up front; each row decodes only the fields the
+        caller actually reads. Use get_matches_for_job for the eager
+        list-of-dicts form.
+        """
+        for row in self._exec(_SQL_GET_MATCHES_FOR_JOB, (job_id,)):
+            yield MatchRow(row)
+
+    def get_matches_for_job(self, job_id: int) -> List[Dict]:
+        """Get all match results for a specific job"""
+        return [match.to_dict() for match in self.iter_matches_for_job(job_id)]
     
+    # Dashboard counts change slowly; a few seconds of staleness is fine
+    # and keeps repeated polls off the database entirely
+    STATS_CACHE_TTL = 5.0
+
     def get_match_statistics(self) -> Dict:
-        """Get overall statistics"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        stats = {}
-        
-        # Total resumes
-        cursor.execute('SELECT COUNT(*) as count FROM resumes')
-        stats['total_resumes'] = cursor.fetchone()['count']
-        
-        # Total jobs
-        cursor.execute('SELECT COUNT(*) as count FROM job_descriptions')
-        stats['total_jobs'] = cursor.fetchone()['count']
-        
-        # Total matches
-        cursor.execute('SELECT COUNT(*) as count FROM match_results')
-        stats['total_matches'] = cursor.fetchone()['count']
-        
-        # Average match score
-        cursor.execute('SELECT AVG(match_score) as avg_score FROM match_results')
-        avg = cursor.fetchone()['avg_score']
-        stats['average_match_score'] = round(avg, 2) if avg else 0
-        
-        conn.close()
+        """Get overall statistics (one query with scalar subqueries, cached)"""
+        cached = self._stats_cache
+        if cached and time.monotonic() - cached[0] < self.STATS_CACHE_TTL:
+            return cached[1]
+
+        row = self._exec(_SQL_GET_STATISTICS).fetchone()
+        stats = {
+            'total_resumes': row['total_resumes'],
+            'total_jobs': row['total_jobs'],
+            'total_matches': row['total_matches'],
+            'average_match_score': round(row['avg_score'], 2) if row['avg_score'] else 0
+        }
+        self._stats_cache = (time.monotonic(), stats)
         return stats
\ No newline at end of file
@@ -16,11 +16,16 @@ reproducible results across different LLM providers.
 
 # src/llm_matcher.py
 import ollama
+import hashlib
 import json
 import re
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
 import os
 
+from config import Config
+
 # Optional: Google Gemini API as fallback
 try:
     import google.generativeai as genai
@@ -28,10 +33,48 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+# Response-parsing patterns, compiled once at import: these run on every
+# LLM call, and module constants skip re's per-call cache lookup
+_RE_NUMBER = re.compile(r'(\d+(?:\.\d+)?)')
+_RE_JUSTIFICATION = re.compile(r'JUSTIFICATION:?\s*(.*?)(?:RECOMMENDATION:|$)',
+                               re.IGNORECASE | re.DOTALL)
+_RE_RECOMMENDATION = re.compile(r'RECOMMENDATION:?\s*(.+?)(?:\n|$)', re.IGNORECASE)
+_RE_MATCHED_LINE = re.compile(r'MATCHED SKILLS:?\s*(.+)', re.IGNORECASE)
+_RE_MISSING_LINE = re.compile(r'MISSING SKILLS:?\s*(.+)', re.IGNORECASE)
+_RE_WORD_TOKEN = re.compile(r'[a-z0-9+#.]+')
+
+@dataclass(slots=True)
+class MatchResult:
+    """One scored resume/job evaluation.
+
+    Slots cut per-record memory to a fraction of an equivalent dict and
+    make field access a fixed-offset lookup, which adds up when thousands
+    of results are held in memory for ranking. to_dict() is the bridge to
+    the JSON/database layers, which stay dict-based.
+    """
+    match_score: float = 5.0
+    justification: str = ''
+    matched_skills: List[str] = field(default_factory=list)
+    missing_skills: List[str] = field(default_factory=list)
+    overall_assessment: str = ''
+    recommendation: str = 'Consider'
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
 class LLMMatcher:
-    def __init__(self, use_gemini=False, gemini_api_key=None):
+    # Re-sent on every chat so Ollama never unloads the model between calls
+    KEEP_ALIVE = '24h'
+
+    def __init__(self, use_gemini=False, gemini_api_key=None, model=None):
         self.use_gemini = use_gemini and GEMINI_AVAILABLE
-        
+        self.model = model or Config.OLLAMA_MODEL
+        # One client for all calls: its underlying httpx connection pool
+        # keeps the localhost socket open instead of a TCP/HTTP setup per
+        # chat, which adds up across a parallel batch
+        self._client = ollama.Client()
+
         if self.use_gemini and gemini_api_key:
             genai.configure(api_key=gemini_api_key)
             self.gemini_model = genai.GenerativeModel('gemini-pro')
@@ -39,177 +82,318 @@ class LLMMatcher:
         elif not use_gemini:
             # Test Ollama connection
             try:
-                ollama.list()
-                print("✅ Using Ollama (Local LLM)")
+                self._client.list()
+                # Preload the model and pin it in memory so the first
+                # /api/match doesn't pay seconds of weight loading
+                self._client.generate(model=self.model, prompt='', keep_alive=self.KEEP_ALIVE)
+                print(f"✅ Using Ollama (Local LLM, {self.model})")
             except Exception as e:
                 print(f"⚠️ Ollama connection failed: {e}")
                 print("Make sure Ollama is running: ollama serve")
     
-    def generate_llm_response(self, prompt: str, model: str = "llama3.2:3b") -> str:
-        """Generate response using LLM"""
+    def generate_llm_response(self, prompt: str, model: str = None,
+                              json_format: bool = False, stream: bool = False) -> str:
+        """Generate response using LLM.
+
+        json_format=True asks the runtime for constrained JSON output
+        (Ollama's format="json" / Gemini's response_mime_type), which makes
+        replies machine-parseable without a regex cleanup pass.
+
+        stream=True consumes the reply as Ollama emits it, so network
+        transfer overlaps generation and the full text is in hand the
+        moment the last token lands (Gemini ignores the flag).
+        """
         try:
             if self.use_gemini:
-                response = self.gemini_model.generate_content(prompt)
+                if json_format:
+                    response = self.gemini_model.generate_content(
+                        prompt,
+                        generation_config={'response_mime_type': 'application/json'})
+                else:
+                    response = self.gemini_model.generate_content(prompt)
                 return response.text
             else:
                 # Use Ollama
-                response = ollama.chat(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": "You are an expert HR recruiter and resume screener."},
-                        {"role": "user", "content": prompt}
-                    ]
+                kwargs = {'format': 'json'} if json_format else {}
+                messages = [
+                    {"role": "system", "content": "You are an expert HR recruiter and resume screener."},
+                    {"role": "user", "content": prompt}
+                ]
+                if stream:
+                    parts = []
+                    for chunk in self._client.chat(
+                            model=model or self.model,
+                            messages=messages,
+                            keep_alive=self.KEEP_ALIVE,
+                            stream=True,
+                            **kwargs):
+                        parts.append(chunk['message']['content'])
+                    return ''.join(parts)
+                response = self._client.chat(
+                    model=model or self.model,
+                    messages=messages,
+                    keep_alive=self.KEEP_ALIVE,
+                    **kwargs
                 )
                 return response['message']['content']
         except Exception as e:
             print(f"❌ LLM generation error: {e}")
             return None
     
-    def match_resume_to_job(self, resume_data: Dict, job_data: Dict) -> Dict:
+    def prompt_signature(self, resume_data: Dict, job_data: Dict) -> str:
+        """Content hash of the inputs that determine a match outcome.
+
+        The resume id is part of the hash: extracted skills come from a
+        small fixed vocabulary, so two different candidates often share a
+        skill set and must never share a stored result.
+        """
+        required_skills = job_data.get('required_skills', [])
+        if isinstance(required_skills, str):
+            required_skills = [s.strip() for s in required_skills.split(',')]
+        payload = json.dumps([
+            resume_data.get('id'),
+            sorted(s.lower() for s in resume_data.get('skills', [])),
+            str(resume_data.get('experience_years', '')),
+            sorted(s.lower() for s in required_skills),
+            str(job_data.get('experience_required', '')),
+            job_data.get('job_description', '')
+        ])
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def match_resume_to_job(self, resume_data: Dict, job_data: Dict,
+                            required_skills: frozenset = None,
+                            job_block: str = None) -> Dict:
         """
         Match resume to job description and provide scoring with justification
-        
+
+        required_skills and job_block are optional pre-computed job-side
+        values (see _prepare_required_skills / _format_job_block) so batch
+        callers don't redo identical work per resume.
+
         Returns:
             Dict with match_score, justification, matched_skills, missing_skills
         """
-        
-        # Build the matching prompt
-        prompt = self._build_matching_prompt(resume_data, job_data)
-        
-        # Get LLM response
-        llm_response = self.generate_llm_response(prompt)
-        
-        if not llm_response:
-            return self._fallback_matching(resume_data, job_data)
-        
-        # Parse the LLM response
-        match_result = self._parse_llm_response(llm_response, resume_data, job_data)
-        
-        return match_result
-    
-    def _build_matching_prompt(self, resume_data: Dict, job_data: Dict) -> str:
-        """Build the prompt for LLM matching"""
-        
-        # Extract key information
-        candidate_name = resume_data.get('candidate_name', 'Unknown')
-        candidate_skills = resume_data.get('skills', [])
-        candidate_exp = resume_data.get('experience_years', 'Not specified')
-        
-        job_title = job_data.get('job_title', 'Position')
-        required_skills = job_data.get('required_skills', [])
-        job_description = job_data.get('job_description', '')
-        experience_required = job_data.get('experience_required', 'Not specified')
-        
-        prompt = f"""Compare the following resume with the job description and provide a detailed match analysis.
+        if job_block is None:
+            job_block = self._format_job_block(job_data)
+
+        # Preferred path: three short sub-prompts running concurrently
+        try:
+            match_result = self._decomposed_match(resume_data, job_data, job_block)
+            if match_result:
+                return match_result.to_dict()
+        except Exception as e:
+            print(f"Decomposed matching failed: {e}")
+
+        # Fallback path: the monolithic prompt in constrained-JSON mode
+        prompt = self._build_matching_prompt(resume_data, job_data, job_block)
+        llm_response = self.generate_llm_response(prompt, json_format=True, stream=True)
+
+        if llm_response:
+            match_result = self._parse_match_json(llm_response)
+            if match_result:
+                return match_result.to_dict()
+
+        return self._fallback_matching(resume_data, job_data, required_skills).to_dict()
+
+    def _decomposed_match(self, resume_data: Dict, job_data: Dict,
+                          job_block: str = None) -> Optional[MatchResult]:
+        """Run skills / score / justification sub-prompts concurrently and fuse.
 
-JOB DETAILS:
-Job Title: {job_title}
+        Each sub-prompt is a fraction of the monolithic prompt, so fewer
+        tokens go in and out per call, and the three calls overlap across
+        Ollama's parallel slots instead of serializing one long generation.
+        """
+        if job_block is None:
+            job_block = self._format_job_block(job_data)
+        candidate_block = self._format_candidate_block(resume_data)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            skills_future = executor.submit(
+                self.generate_llm_response,
+                self._build_skills_prompt(job_block, candidate_block))
+            score_future = executor.submit(
+                self.generate_llm_response,
+                self._build_score_prompt(job_block, candidate_block))
+            justification_future = executor.submit(
+                self.generate_llm_response,
+                self._build_justification_prompt(job_block, candidate_block))
+            skills_response = skills_future.result()
+            score_response = score_future.result()
+            justification_response = justification_future.result()
+
+        if not (skills_response and score_response and justification_response):
+            return None
+
+        matched_skills, missing_skills = self._parse_skills_response(skills_response)
+        score = self._parse_score(score_response)
+        justification, recommendation = self._parse_justification_response(justification_response)
+
+        return MatchResult(
+            match_score=score,
+            justification=justification,
+            matched_skills=matched_skills,
+            missing_skills=missing_skills,
+            overall_assessment=f"Match Score: {score}/10 - {recommendation}",
+            recommendation=recommendation
+        )
+
+    def _format_job_block(self, job_data: Dict) -> str:
+        """Format the shared JOB DETAILS section used by all sub-prompts"""
+        required_skills = job_data.get('required_skills', [])
+        return f"""JOB DETAILS:
+Job Title: {job_data.get('job_title', 'Position')}
 Required Skills: {', '.join(required_skills) if isinstance(required_skills, list) else required_skills}
-Experience Required: {experience_required}
-Job Description: {job_description[:500]}
+Experience Required: {job_data.get('experience_required', 'Not specified')}
+Job Description: {job_data.get('job_description', '')[:500]}"""
 
-CANDIDATE DETAILS:
-Name: {candidate_name}
+    def _format_candidate_block(self, resume_data: Dict) -> str:
+        """Format the shared CANDIDATE DETAILS section used by all sub-prompts"""
+        candidate_skills = resume_data.get('skills', [])
+        return f"""CANDIDATE DETAILS:
+Name: {resume_data.get('candidate_name', 'Unknown')}
 Skills: {', '.join(candidate_skills[:20]) if candidate_skills else 'None specified'}
-Experience: {candidate_exp}
+Experience: {resume_data.get('experience_years', 'Not specified')}"""
+
+    def _build_skills_prompt(self, job_block: str, candidate_block: str) -> str:
+        return f"""{job_block}
+
+{candidate_block}
+
+Compare the candidate's skills with the job's required skills.
+Respond with exactly two lines:
+
+MATCHED SKILLS: [comma-separated skills the candidate has that the job requires]
+MISSING SKILLS: [comma-separated required skills the candidate lacks]
+"""
+
+    def _build_score_prompt(self, job_block: str, candidate_block: str) -> str:
+        return f"""{job_block}
+
+{candidate_block}
 
-TASK:
 Rate the fit between this candidate and the job on a scale of 1-10, where:
 - 1-3: Poor fit (major gaps in requirements)
 - 4-6: Moderate fit (some relevant skills but significant gaps)
 - 7-8: Good fit (most requirements met)
 - 9-10: Excellent fit (all or nearly all requirements met with strong alignment)
 
-Provide your response in the following format:
-
-MATCH SCORE: [score from 1-10]
+Respond with only the number.
+"""
 
-MATCHED SKILLS:
-- [list skills that match between candidate and job requirements]
+    def _build_justification_prompt(self, job_block: str, candidate_block: str) -> str:
+        return f"""{job_block}
 
-MISSING SKILLS:
-- [list required skills that candidate doesn't have]
+{candidate_block}
 
-JUSTIFICATION:
-[Provide 2-3 sentences explaining the score, highlighting strengths and gaps]
+Respond with exactly two lines:
 
-RECOMMENDATION:
-[Provide a hiring recommendation: "Strong Hire", "Consider", "Maybe", or "Pass"]
+JUSTIFICATION: [2-3 sentences on the candidate's fit, highlighting strengths and gaps]
+RECOMMENDATION: [one of: "Strong Hire", "Consider", "Maybe", "Pass"]
 """
-        
-        return prompt
-    
-    def _parse_llm_response(self, llm_response: str, resume_data: Dict, job_data: Dict) -> Dict:
-        """Parse the LLM response into structured data"""
-        
-        result = {
-            'match_score': 5.0,
-            'justification': '',
-            'matched_skills': [],
-            'missing_skills': [],
-            'overall_assessment': '',
-            'recommendation': 'Consider'
-        }
-        
-        # Extract match score
-        score_match = re.search(r'MATCH SCORE:?\s*(\d+(?:\.\d+)?)', llm_response, re.IGNORECASE)
-        if score_match:
+
+    def _parse_score(self, score_response: str) -> float:
+        """Extract and clamp the 1-10 score from a score sub-prompt response"""
+        match = _RE_NUMBER.search(score_response)
+        if match:
             try:
-                score = float(score_match.group(1))
-                result['match_score'] = min(10.0, max(1.0, score))
-            except:
+                return min(10.0, max(1.0, float(match.group(1))))
+            except ValueError:
                 pass
-        
-        # Extract matched skills
-        matched_section = re.search(r'MATCHED SKILLS:?(.*?)(?:MISSING SKILLS:|JUSTIFICATION:|$)', 
-                                   llm_response, re.IGNORECASE | re.DOTALL)
-        if matched_section:
-            matched_text = matched_section.group(1)
-            # Extract bullet points or comma-separated items
-            matched_items = re.findall(r'[-•]\s*(.+?)(?:\n|$)', matched_text)
-            if not matched_items:
-                matched_items = [s.strip() for s in matched_text.split(',') if s.strip()]
-            result['matched_skills'] = [item.strip() for item in matched_items if item.strip()][:10]
-        
-        # Extract missing skills
-        missing_section = re.search(r'MISSING SKILLS:?(.*?)(?:JUSTIFICATION:|RECOMMENDATION:|$)', 
-                                   llm_response, re.IGNORECASE | re.DOTALL)
-        if missing_section:
-            missing_text = missing_section.group(1)
-            missing_items = re.findall(r'[-•]\s*(.+?)(?:\n|$)', missing_text)
-            if not missing_items:
-                missing_items = [s.strip() for s in missing_text.split(',') if s.strip()]
-            result['missing_skills'] = [item.strip() for item in missing_items if item.strip()][:10]
-        
-        # Extract justification
-        justification_section = re.search(r'JUSTIFICATION:?(.*?)(?:RECOMMENDATION:|$)', 
-                                         llm_response, re.IGNORECASE | re.DOTALL)
-        if justification_section:
-            result['justification'] = justification_section.group(1).strip()
-        
-        # Extract recommendation
-        recommendation_section = re.search(r'RECOMMENDATION:?\s*(.+?)(?:\n|$)', 
-                                          llm_response, re.IGNORECASE)
-        if recommendation_section:
-            result['recommendation'] = recommendation_section.group(1).strip()
-        
-        # Overall assessment
-        result['overall_assessment'] = f"Match Score: {result['match_score']}/10 - {result['recommendation']}"
-        
-        return result
+        return 5.0
+
+    def _parse_skills_response(self, skills_response: str):
+        """Extract matched/missing skill lists from a skills sub-prompt response"""
+        def parse_line(pattern):
+            match = pattern.search(skills_response)
+            if not match:
+                return []
+            items = [s.strip(' -•') for s in match.group(1).split(',')]
+            return [item for item in items if item and item.lower() != 'none'][:10]
+
+        return parse_line(_RE_MATCHED_LINE), parse_line(_RE_MISSING_LINE)
+
+    def _parse_justification_response(self, justification_response: str):
+        """Extract justification text and recommendation from the sub-prompt response"""
+        justification_match = _RE_JUSTIFICATION.search(justification_response)
+        justification = justification_match.group(1).strip() if justification_match \
+            else justification_response.strip()
+
+        recommendation_match = _RE_RECOMMENDATION.search(justification_response)
+        recommendation = recommendation_match.group(1).strip() if recommendation_match else 'Consider'
+
+        return justification, recommendation
     
-    def _fallback_matching(self, resume_data: Dict, job_data: Dict) -> Dict:
-        """Fallback matching algorithm if LLM fails"""
-        
-        candidate_skills = set([s.lower() for s in resume_data.get('skills', [])])
-        
-        # Handle both list and string formats for required skills
+    def _build_matching_prompt(self, resume_data: Dict, job_data: Dict,
+                               job_block: str = None) -> str:
+        """Build the single-candidate prompt, asking for a JSON reply"""
+        return f"""Compare the following resume with the job description and provide a detailed match analysis.
+
+{job_block if job_block is not None else self._format_job_block(job_data)}
+
+{self._format_candidate_block(resume_data)}
+
+TASK:
+Rate the fit between this candidate and the job on a scale of 1-10, where:
+- 1-3: Poor fit (major gaps in requirements)
+- 4-6: Moderate fit (some relevant skills but significant gaps)
+- 7-8: Good fit (most requirements met)
+- 9-10: Excellent fit (all or nearly all requirements met with strong alignment)
+
+Respond with ONLY a JSON object in exactly this shape:
+{{"match_score": 7, "matched_skills": ["skill"], "missing_skills": ["skill"], "justification": "2-3 sentences explaining the score", "recommendation": "Strong Hire" or "Consider" or "Maybe" or "Pass"}}
+"""
+
+    def _parse_match_json(self, llm_response: str) -> Optional[MatchResult]:
+        """Validate and clamp the model's JSON reply; None if unusable"""
+        start = llm_response.find('{')
+        end = llm_response.rfind('}')
+        if start == -1 or end <= start:
+            return None
+        try:
+            payload = json.loads(llm_response[start:end + 1])
+        except ValueError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+
+        try:
+            score = min(10.0, max(1.0, float(payload.get('match_score', 5))))
+        except (TypeError, ValueError):
+            score = 5.0
+        matched = payload.get('matched_skills') if isinstance(payload.get('matched_skills'), list) else []
+        missing = payload.get('missing_skills') if isinstance(payload.get('missing_skills'), list) else []
+        recommendation = str(payload.get('recommendation', 'Consider')).strip() or 'Consider'
+
+        return MatchResult(
+            match_score=score,
+            justification=str(payload.get('justification', '')).strip(),
+            matched_skills=[str(s) for s in matched][:10],
+            missing_skills=[str(s) for s in missing][:10],
+            overall_assessment=f"Match Score: {score}/10 - {recommendation}",
+            recommendation=recommendation
+        )
+    
+    def _prepare_required_skills(self, job_data: Dict) -> frozenset:
+        """Normalize the job's required skills once, for reuse across a batch.
+
+        The job side is constant for all N resumes in a batch, so callers
+        hoist this out of the loop instead of re-lowercasing per resume.
+        Handles both list and comma-separated string formats.
+        """
         required_skills_raw = job_data.get('required_skills', [])
         if isinstance(required_skills_raw, str):
-            required_skills = set([s.strip().lower() for s in required_skills_raw.split(',')])
-        else:
-            required_skills = set([s.lower() for s in required_skills_raw])
-        
+            return frozenset(s.strip().lower() for s in required_skills_raw.split(',') if s.strip())
+        return frozenset(s.lower() for s in required_skills_raw)
+
+    def _fallback_matching(self, resume_data: Dict, job_data: Dict,
+                           required_skills: frozenset = None) -> MatchResult:
+        """Fallback matching algorithm if LLM fails"""
+
+        candidate_skills = set([s.lower() for s in resume_data.get('skills', [])])
+
+        if required_skills is None:
+            required_skills = self._prepare_required_skills(job_data)
+
         # Calculate matches
         matched = candidate_skills.intersection(required_skills)
         missing = required_skills - candidate_skills
@@ -229,34 +413,181 @@ RECOMMENDATION:
         else:
             justification = f"Limited fit with only {len(matched)} matching skills out of {len(required_skills)} required."
         
-        return {
-            'match_score': score,
-            'justification': justification,
-            'matched_skills': list(matched),
-            'missing_skills': list(missing),
-            'overall_assessment': f"Automated Score: {score}/10",
-            'recommendation': 'Strong Hire' if score >= 8 else 'Consider' if score >= 5 else 'Pass'
-        }
+        return MatchResult(
+            match_score=score,
+            justification=justification,
+            matched_skills=list(matched),
+            missing_skills=list(missing),
+            overall_assessment=f"Automated Score: {score}/10",
+            recommendation='Strong Hire' if score >= 8 else 'Consider' if score >= 5 else 'Pass'
+        )
     
-    def batch_match_resumes(self, resumes: List[Dict], job_data: Dict) -> List[Dict]:
+    def prefilter_resumes(self, resumes: List[Dict], job_data: Dict, top_k: int = 50) -> List[Dict]:
+        """Cheaply rank resumes by lexical overlap and keep the top K.
+
+        Scoring a clearly unrelated resume costs a multi-second LLM call;
+        ranking it costs a couple of set intersections. Resumes are ranked
+        by overlap between their extracted skills and the job's required
+        skills plus the job text, and only the top K reach the LLM.
         """
-        Match multiple resumes against a single job description
-        
+        if top_k <= 0 or len(resumes) <= top_k:
+            return resumes
+
+        required = self._prepare_required_skills(job_data)
+
+        job_text = f"{job_data.get('job_title', '')} {job_data.get('job_description', '')}"
+        job_tokens = set(_RE_WORD_TOKEN.findall(job_text.lower()))
+
+        def relevance(resume):
+            skills = {s.lower() for s in resume.get('skills', [])}
+            skill_overlap = len(skills & required) / len(required) if required else 0.0
+            token_overlap = len(skills & job_tokens) / len(skills) if skills else 0.0
+            return skill_overlap * 2.0 + token_overlap
+
+        return sorted(resumes, key=relevance, reverse=True)[:top_k]
+
+    # Candidates per bulk prompt: enough to amortize the job-description
+    # tokens, small enough that the model keeps the rows straight
+    BULK_CHUNK_SIZE = 10
+
+    def _build_batch_matching_prompt(self, resumes: List[Dict], job_data: Dict,
+                                     job_block: str = None) -> str:
+        """Build one prompt scoring a whole chunk of candidates.
+
+        The job details appear once instead of once per resume, so the
+        fixed prompt tokens are amortized across the chunk.
+        """
+        if job_block is None:
+            job_block = self._format_job_block(job_data)
+        lines = []
+        for i, resume in enumerate(resumes, 1):
+            skills = resume.get('skills', [])
+            lines.append(
+                f"{i}. {resume.get('candidate_name', 'Unknown')} | "
+                f"Skills: {', '.join(skills[:20]) if skills else 'None specified'} | "
+                f"Experience: {resume.get('experience_years', 'Not specified')}")
+
+        return f"""{job_block}
+
+CANDIDATES:
+{chr(10).join(lines)}
+
+Rate each candidate's fit with the job on a scale of 1-10.
+Return ONLY a JSON array with one object per candidate, in the same order:
+[{{"id": 1, "score": 7, "matched": ["skill"], "missing": ["skill"], "justification": "2-3 sentences"}}]
+"""
+
+    def _bulk_match_chunk(self, resumes: List[Dict], job_data: Dict,
+                          required_skills: frozenset = None,
+                          job_block: str = None) -> Optional[List[Dict]]:
+        """Score one chunk with a single prompt; None if the reply is unusable"""
+        response = self.generate_llm_response(
+            self._build_batch_matching_prompt(resumes, job_data, job_block),
+            json_format=True, stream=True)
+        if not response:
+            return None
+
+        start = response.find('[')
+        end = response.rfind(']')
+        if start == -1 or end <= start:
+            return None
+        try:
+            rows = json.loads(response[start:end + 1])
+        except ValueError:
+            return None
+        if not isinstance(rows, list):
+            return None
+
+        by_index = {}
+        for row in rows:
+            if isinstance(row, dict):
+                try:
+                    by_index[int(row.get('id'))] = row
+                except (TypeError, ValueError):
+                    continue
+
+        results = []
+        for i, resume in enumerate(resumes, 1):
+            row = by_index.get(i)
+            if row is None:
+                # Model skipped this candidate; rule-based score beats nothing
+                results.append(self._fallback_matching(resume, job_data, required_skills))
+                continue
+            try:
+                score = min(10.0, max(1.0, float(row.get('score', 5))))
+            except (TypeError, ValueError):
+                score = 5.0
+            matched = row.get('matched') if isinstance(row.get('matched'), list) else []
+            missing = row.get('missing') if isinstance(row.get('missing'), list) else []
+            recommendation = 'Strong Hire' if score >= 8 else 'Consider' if score >= 5 else 'Pass'
+            results.append(MatchResult(
+                match_score=score,
+                justification=str(row.get('justification', '')).strip(),
+                matched_skills=[str(s) for s in matched][:10],
+                missing_skills=[str(s) for s in missing][:10],
+                overall_assessment=f"Match Score: {score}/10 - {recommendation}",
+                recommendation=recommendation
+            ))
+        return [match.to_dict() for match in results]
+
+    def batch_match_resumes(self, resumes: List[Dict], job_data: Dict,
+                            max_workers: int = None, bulk: bool = False) -> List[Dict]:
+        """
+        Match multiple resumes against a single job description.
+
+        Each match blocks on LLM network I/O, so the batch fans out across
+        a thread pool: wall-clock time scales with ceil(N / workers)
+        instead of N. Keep workers in line with Ollama's num_parallel.
+
+        With bulk=True, chunks of BULK_CHUNK_SIZE candidates share a single
+        prompt (the job text is sent once per chunk instead of once per
+        resume); any chunk whose JSON comes back malformed falls back to
+        per-resume matching.
+
         Returns:
             List of match results sorted by score (highest first)
         """
+        if not resumes:
+            return []
+
+        # Job-side work is identical for every resume in the batch:
+        # normalize the skills and render the prompt block once
+        required_skills = self._prepare_required_skills(job_data)
+        job_block = self._format_job_block(job_data)
+
+        if bulk:
+            results = []
+            for chunk_start in range(0, len(resumes), self.BULK_CHUNK_SIZE):
+                chunk = resumes[chunk_start:chunk_start + self.BULK_CHUNK_SIZE]
+                chunk_results = self._bulk_match_chunk(chunk, job_data, required_skills, job_block)
+                if chunk_results is None:
+                    chunk_results = [self.match_resume_to_job(r, job_data, required_skills, job_block)
+                                     for r in chunk]
+                for resume, match_result in zip(chunk, chunk_results):
+                    match_result['resume_id'] = resume.get('id')
+                    match_result['candidate_name'] = resume.get('candidate_name', 'Unknown')
+                    match_result['email'] = resume.get('email')
+                    results.append(match_result)
+            results.sort(key=lambda x: x['match_score'], reverse=True)
+            return results
+
+        workers = max_workers or Config.LLM_MATCH_WORKERS
         results = []
-        
-        for resume in resumes:
-            match_result = self.match_resume_to_job(resume, job_data)
-            match_result['resume_id'] = resume.get('id')
-            match_result['candidate_name'] = resume.get('candidate_name', 'Unknown')
-            match_result['email'] = resume.get('email')
-            results.append(match_result)
-        
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(resumes))) as executor:
+            futures = [executor.submit(self.match_resume_to_job, resume, job_data,
+                                       required_skills, job_block)
+                       for resume in resumes]
+            for resume, future in zip(resumes, futures):
+                match_result = future.result()
+                match_result['resume_id'] = resume.get('id')
+                match_result['candidate_name'] = resume.get('candidate_name', 'Unknown')
+                match_result['email'] = resume.get('email')
+                results.append(match_result)
+
         # Sort by match score (descending)
         results.sort(key=lambda x: x['match_score'], reverse=True)
-        
+
         return results
     
     def test_connection(self) -> bool: